@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-import os
+import enum
 import pathlib
 import sys
 import typing as t
 
+from pydantic import Discriminator
+from pydantic import Tag
+from pydantic import field_validator
 from pydantic import model_validator
 
 from audex.helper.mixin import ContextMixin
@@ -63,8 +66,29 @@ class Rotation(BaseModel):
         return self
 
 
+class StdStream(str, enum.Enum):
+    """Standard stream targets, named after the matching `sys`
+    attribute."""
+
+    STDOUT = "stdout"
+    STDERR = "stderr"
+
+
+_STD_STREAMS = frozenset(stream.value for stream in StdStream)
+
+
+def _logname_tag(value: t.Any) -> str:
+    return "std" if isinstance(value, str) and value in _STD_STREAMS else "path"
+
+
+Logname = t.Annotated[
+    t.Annotated[StdStream, Tag("std")] | t.Annotated[pathlib.PurePath, Tag("path")],
+    Discriminator(_logname_tag),
+]
+
+
 class LoggingTarget(ContextMixin, BaseModel):
-    logname: t.Literal["stdout", "stderr"] | os.PathLike[str] = Field(
+    logname: Logname = Field(
         default="stdout",
         description="Name of the target, can be 'stdout', 'stderr', or a file path",
     )
@@ -81,7 +105,7 @@ class LoggingTarget(ContextMixin, BaseModel):
         "critical",
         "CRITICAL",
     ] = Field(
-        default="info",
+        default="INFO",
         description="Log level for this target",
     )
 
@@ -90,31 +114,47 @@ class LoggingTarget(ContextMixin, BaseModel):
         description="Configuration for log rotation",
     )
 
+    @field_validator("loglevel", mode="after")
+    @classmethod
+    def normalize_loglevel(cls, v: str) -> str:
+        # Store the form loguru expects so `init()` can pass it through as is
+        return v.upper()
+
+
+_DEFAULT_LOG_PATH = pathlib.Path("logs/audex.jsonl")
+_WINDOWS_LOG_PATH = pathlib.PureWindowsPath("%PROGRAMDATA%\\logs\\audex.log")
+_LINUX_LOG_PATH = pathlib.PurePosixPath("${HOME}/.local/share/audex/logs/audex.log")
+
+# Built once from trusted literals, so validation is skipped. Values are
+# given in their validated form (upper-case levels, std streams stored by
+# value). The models are mutable, so every config gets a deep copy.
+_DEFAULT_TARGETS = (
+    LoggingTarget.model_construct(logname=StdStream.STDOUT.value, loglevel="DEBUG"),
+    LoggingTarget.model_construct(logname=StdStream.STDERR.value, loglevel="ERROR"),
+    LoggingTarget.model_construct(
+        logname=_DEFAULT_LOG_PATH,
+        loglevel="INFO",
+        rotation=Rotation.model_construct(size_based=SizeBasedRotation.model_construct()),
+    ),
+)
+
 
 class LoggingConfig(BaseModel):
     targets: list[LoggingTarget] = Field(
-        default_factory=lambda: [
-            LoggingTarget(logname="stdout", loglevel="debug"),
-            LoggingTarget(logname="stderr", loglevel="error"),
-            LoggingTarget(
-                logname=pathlib.Path("logs/audex.jsonl"),
-                loglevel="info",
-                rotation=Rotation(size_based=SizeBasedRotation()),
-            ),
-        ],
+        default_factory=lambda: [target.model_copy(deep=True) for target in _DEFAULT_TARGETS],
         description="List of logging targets",
         windows_default=lambda: [
-            LoggingTarget(logname="stdout", loglevel="info"),
+            LoggingTarget(logname=StdStream.STDOUT, loglevel="info"),
             LoggingTarget(
-                logname=pathlib.PureWindowsPath("%PROGRAMDATA%\\logs\\audex.log"),
+                logname=_WINDOWS_LOG_PATH,
                 loglevel="info",
                 rotation=Rotation(size_based=SizeBasedRotation()),
             ),
         ],
         linux_default=lambda: [
-            LoggingTarget(logname="stdout", loglevel="info"),
+            LoggingTarget(logname=StdStream.STDOUT, loglevel="info"),
             LoggingTarget(
-                logname=pathlib.PurePosixPath("${HOME}/.local/share/audex/logs/audex.log"),
+                logname=_LINUX_LOG_PATH,
                 loglevel="info",
                 rotation=Rotation(size_based=SizeBasedRotation()),
             ),
@@ -132,14 +172,13 @@ class LoggingConfig(BaseModel):
 
         # Set up each logging target
         for target in self.targets:
-            level = target.loglevel.upper()
-            if target.logname == "stdout":
-                logger.add(sys.stdout, level=level)
-                continue
-            if target.logname == "stderr":
-                logger.add(sys.stderr, level=level)
-                continue
+            level = target.loglevel
             sink = target.logname
+            if isinstance(sink, str):
+                # Standard streams are stored by value, which is also the
+                # name of the corresponding `sys` attribute.
+                logger.add(getattr(sys, sink), level=level)
+                continue
 
             # Configure rotation if specified
             if target.rotation:
@@ -8,13 +8,14 @@ from audex.helper.settings.fields import Field
 
 
 class InmemoryCacheConfig(BaseModel):
-    cache_type: t.Literal["lru", "lfu", "ttl", "fifo"] = Field(
+    cache_type: t.Literal["lru", "lfu", "ttl", "fifo", "tinylfu", "clock", "wsclock"] = Field(
         default="ttl",
         description="Type of in-memory cache algorithm to use.",
     )
 
     max_size: int = Field(
         default=1024,
+        gt=0,
         description="Maximum number of items to store in the cache.",
     )
 
@@ -28,6 +29,26 @@ class InmemoryCacheConfig(BaseModel):
         description="TTL for negative cache entries in seconds.",
     )
 
+    sketch_width: int | None = Field(
+        default=None,
+        description="Width of the TinyLFU frequency sketch. Defaults to ten times `max_size`.",
+    )
+
+    working_set: int | None = Field(
+        default=None,
+        description="WSCLOCK working-set window in seconds. Defaults to `default_ttl`.",
+    )
+
+    purge_interval: float = Field(
+        default=60.0,
+        description="Seconds between background sweeps for expired entries.",
+    )
+
+    purge_batch: int = Field(
+        default=1024,
+        description="Maximum number of entries inspected per expiry sweep.",
+    )
+
 
 class CacheConfig(BaseModel):
     provider: t.Literal["inmemory"] = Field(
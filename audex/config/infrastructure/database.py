@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import typing as t
+
+from pydantic import PrivateAttr
+from pydantic import model_validator
+
 from audex.helper.settings import BaseModel
 from audex.helper.settings.fields import Field
 
+if t.TYPE_CHECKING:
+    import sqlalchemy as sa
+
 
 class SQLiteConfig(BaseModel):
     uri: str = Field(
@@ -42,7 +50,43 @@ class SQLiteConfig(BaseModel):
         description="Enable connection health checks before using a connection from the pool.",
     )
 
+    pool_use_lifo: bool = Field(
+        default=True,
+        description="Reuse the most recently returned connection first.",
+    )
+
+    busy_timeout: float = Field(
+        default=5.0,
+        description="The timeout in seconds to wait on a locked database before failing.",
+    )
+
     create_all: bool = Field(
         default=True,
         description="Whether to create all tables on initialization.",
     )
+
+    # Parsed `uri`, kept with the string it came from so copies and
+    # assignments that change `uri` are re-parsed
+    _url: tuple[str, sa.URL] | None = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def parse_uri(self) -> t.Self:
+        # Parse once here so a malformed URI fails at load time and the
+        # engine can reuse the parsed URL
+        from sqlalchemy.engine import make_url
+        from sqlalchemy.exc import ArgumentError
+
+        try:
+            self._url = (self.uri, make_url(self.uri))
+        except ArgumentError as e:
+            raise ValueError(f"Invalid SQLite URI: {self.uri!r}") from e
+        return self
+
+    @property
+    def url(self) -> sa.URL:
+        """The parsed form of `uri`."""
+        if self._url is None or self._url[0] != self.uri:
+            from sqlalchemy.engine import make_url
+
+            self._url = (self.uri, make_url(self.uri))
+        return self._url[1]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import threading
+import typing as t
+
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from audex.config.core import CoreConfig
+from audex.config.infrastructure import InfrastructureConfig
+from audex.config.provider import ProviderConfig
+from audex.helper.mixin import ContextMixin
+from audex.helper.settings import Settings
+
+
+class Config(ContextMixin, Settings):
+    model_config: t.ClassVar[SettingsConfigDict] = SettingsConfigDict(
+        env_prefix="AUDEX__",
+        validate_default=False,
+        env_nested_delimiter="__",
+        env_file=".env",
+        extra="ignore",
+    )
+
+    _instance: t.ClassVar[Config | None] = None
+    _instance_lock: t.ClassVar[threading.Lock] = threading.Lock()
+
+    core: CoreConfig = Field(
+        default_factory=CoreConfig,
+        description="Core configuration settings.",
+    )
+
+    provider: ProviderConfig = Field(
+        default_factory=ProviderConfig,
+        description="Provider configuration settings.",
+    )
+
+    infrastructure: InfrastructureConfig = Field(
+        default_factory=InfrastructureConfig,
+        description="Infrastructure configuration settings.",
+    )
+
+    def init(self) -> None:
+        self.core.logging.init()
+
+    @classmethod
+    def instance(cls) -> Config:
+        """Return the process-wide configuration, building it on first
+        access.
+
+        Returns:
+            The shared configuration instance.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
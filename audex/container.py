@@ -12,7 +12,7 @@ from audex.view.container import ViewContainer
 
 class Container(containers.DeclarativeContainer):
     # Configuration
-    config = providers.Callable(config)
+    config = providers.Singleton(config)
 
     # Containers
     infrastructure = providers.Container(InfrastructureContainer, config=config)
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import datetime
 import functools as ft
+import inspect
+import sys
 import typing as t
 
 from audex import utils
+from audex.entity.fields import _MISSING
 from audex.entity.fields import DateTimeField
 from audex.entity.fields import FieldSpec
 from audex.entity.fields import StringField
@@ -15,13 +18,24 @@ class EntityMeta(type):
     """Metaclass for Entity that collects all Field descriptors.
 
     This metaclass automatically discovers all Field descriptors defined in the
-    class hierarchy and stores them in the _fields class attribute. It processes
-    field inheritance by scanning through the method resolution order (MRO) to
-    ensure proper field override behavior.
+    class hierarchy and stores them in the _fields class attribute. Each entity
+    class's _fields covers its whole hierarchy, so a new class only merges the
+    _fields of its direct bases, in method resolution order, before adding its
+    own fields.
+
+    Field values are stored in `_field_<name>` slots that the metaclass adds
+    to `__slots__`, so entity instances have no `__dict__`. As with any
+    slotted classes, an entity cannot inherit from two entity classes that
+    both declare their own fields.
 
     Attributes:
         _fields: Class-level dictionary mapping field names to their FieldSpec
             descriptors.
+        _field_names: Field names in declaration order.
+        _field_slots: Private storage attribute names, aligned with
+            `_field_names`.
+        _sortable_fields: Names of the fields that support sorting.
+        _nested_fields: Names of the fields that may hold nested entities.
 
     Example:
         ```python
@@ -39,6 +53,10 @@ class EntityMeta(type):
     """
 
     _fields: dict[str, FieldSpec[t.Any]]
+    _field_names: tuple[str, ...]
+    _field_slots: tuple[str, ...]
+    _sortable_fields: frozenset[str]
+    _nested_fields: frozenset[str]
 
     def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, t.Any]) -> EntityMeta:
         """Create a new Entity class with field collection.
@@ -51,44 +69,155 @@ class EntityMeta(type):
         Returns:
             New EntityMeta class with collected fields in _fields attribute.
         """
+        namespace["__slots__"] = mcs._storage_slots(bases, namespace)
         cls = super().__new__(mcs, name, bases, namespace)
 
+        # A subclass of a single entity that declares no fields shares its
+        # base's field tables and generated methods, which are never
+        # mutated after class creation, so they are simply inherited.
+        if (
+            len(bases) == 1
+            and isinstance(bases[0], EntityMeta)
+            and not any(isinstance(value, FieldSpec) for value in namespace.values())
+        ):
+            return cls
+
         # Collect fields from base classes and the current class
         fields: dict[str, FieldSpec[t.Any]] = {}
 
         # Helper: scan a class __dict__ for Field instances
         def scan_dict_for_fields(obj: type) -> dict[str, FieldSpec[t.Any]]:
-            result: dict[str, FieldSpec[t.Any]] = {}
-            for k, v in getattr(obj, "__dict__", {}).items():
-                if isinstance(v, FieldSpec):
-                    result[k] = v
-            return result
-
-        # Collect fields from base classes in inheritance order (base classes first).
-        # This makes later subclass definitions override earlier ones.
-        for base in reversed(cls.__mro__[:-1]):  # exclude 'object'
-            # If base has _fields prepared by EntityMeta, reuse it (fast, canonical).
-            base_fields = getattr(base, "_fields", None)
-            if isinstance(base_fields, dict):
-                # copy to avoid accidental mutation
-                for k, v in base_fields.items():
-                    fields[k] = v
+            # Every class in an MRO has a __dict__, no fallback needed
+            return {k: v for k, v in vars(obj).items() if isinstance(v, FieldSpec)}
+
+        # Collect fields from the direct bases, last base first, so earlier
+        # bases override later ones as in the MRO. An entity base's _fields
+        # already holds its whole hierarchy, so there is no need to walk
+        # further up.
+        for base in reversed(bases):
+            if isinstance(base, EntityMeta):
+                fields.update(base._fields)
             else:
-                # Fallback: scan base.__dict__ for Field descriptors (covers mixins)
-                scanned = scan_dict_for_fields(base)
-                for k, v in scanned.items():
-                    # Only add when not already present (earlier base or subclass will override)
-                    if k not in fields:
-                        fields[k] = v
+                # Fallback: scan plain mixins for Field descriptors
+                for klass in base.__mro__[:-1]:  # exclude 'object'
+                    scanned = scan_dict_for_fields(klass)
+                    for k, v in scanned.items():
+                        # Only add when not already present (subclass will override)
+                        if k not in fields:
+                            fields[k] = v
 
         # Finally, collect fields declared on this class namespace (these override bases).
-        for key, value in namespace.items():
-            if isinstance(value, FieldSpec):
-                fields[key] = value
+        fields.update({k: v for k, v in namespace.items() if isinstance(v, FieldSpec)})
 
         cls._fields = fields
+        # Precomputed once so per-instance loops never format names. The
+        # formatted slot names are interned like the identifiers they
+        # shadow, so attribute lookups on them compare by identity.
+        cls._field_names = tuple(sys.intern(name) for name in fields)
+        cls._field_slots = tuple(sys.intern(f"_field_{name}") for name in fields)
+        cls._sortable_fields = frozenset(k for k, v in fields.items() if v.sortable)
+        cls._nested_fields = frozenset(k for k, v in fields.items() if v.nests_entities)
+
+        # The root entity class keeps the generic implementations
+        if any(isinstance(base, EntityMeta) for base in bases):
+            mcs._generate_methods(cls)
         return cls
 
+    @staticmethod
+    def _generate_methods(cls: EntityMeta) -> None:
+        """Install field-specialized `__init__`, `dumps` and `__repr__`.
+
+        The generic implementations on `Entity` loop over the field
+        tables on every call. Here the same logic is unrolled into
+        straight-line code with the field and storage names written out
+        as literals, compiled once per class. Methods defined by the
+        class or one of its bases are left alone.
+
+        Args:
+            cls: The entity class being created.
+        """
+        pairs = list(zip(cls._field_names, cls._field_slots, strict=True))
+
+        init = ["def __init__(self, **kwargs):", "    if kwargs:"]
+        for name, _ in pairs:
+            init.append(f"        if {name!r} in kwargs: self.{name} = kwargs[{name!r}]")
+        if not pairs:
+            init.append("        pass")
+
+        dumps = ["def dumps(self):", "    result = {}"]
+        for name, slot in pairs:
+            dumps.append(f"    value = getattr(self, {slot!r}, _MISSING)")
+            dumps.append("    if value is not _MISSING:")
+            if name in cls._nested_fields:
+                dumps.append("        if isinstance(value, Entity): value = value.dumps()")
+            dumps.append(f"        result[{name!r}] = value")
+        dumps.append("    return result")
+
+        rep = ["def __repr__(self):", "    attrs = []"]
+        for name, slot in pairs:
+            rep.append(f"    value = getattr(self, {slot!r}, _MISSING)")
+            rep.append(f"    if value is not _MISSING: attrs.append(f'{name}={{value!r}}')")
+        rep.append("    return f\"ENTITY <{self.__class__.__name__}({', '.join(attrs)})>\"")
+
+        generated: dict[str, t.Any] = {}
+        exec("\n".join([*init, *dumps, *rep]), globals(), generated)  # noqa: S102
+
+        for method_name, method in generated.items():
+            if not EntityMeta._is_generated(cls, method_name):
+                continue
+            method.__qualname__ = f"{cls.__qualname__}.{method_name}"
+            method.__doc__ = getattr(Entity, method_name).__doc__
+            method.__entity_generated__ = True
+            setattr(cls, method_name, method)
+
+    @staticmethod
+    def _is_generated(cls: type, method_name: str) -> bool:
+        """Whether `method_name` on `cls` may be replaced by generated
+        code, i.e. it resolves to the root entity class or to code
+        generated for a base."""
+        for klass in cls.__mro__:
+            if method_name in vars(klass):
+                method = vars(klass)[method_name]
+                is_root = not any(isinstance(base, EntityMeta) for base in klass.__bases__)
+                return is_root or getattr(method, "__entity_generated__", False)
+        return False
+
+    @staticmethod
+    def _storage_slots(bases: tuple[type, ...], namespace: dict[str, t.Any]) -> tuple[str, ...]:
+        """Compute the `__slots__` of a new entity class.
+
+        Adds a `_field_<name>` slot for every field whose storage is not
+        already provided by an entity base, so instances carry no
+        `__dict__`. Fields inherited from plain mixins get their slot on
+        the first entity class that uses them. Slots declared explicitly
+        in the class body are kept.
+
+        Args:
+            bases: Base classes of the new class.
+            namespace: Class namespace containing attributes and methods.
+
+        Returns:
+            The slot names for the new class.
+        """
+        declared = namespace.get("__slots__", ())
+        slots: list[str] = [declared] if isinstance(declared, str) else list(declared)
+
+        inherited: set[str] = set()
+        candidates: list[str] = []
+        for base in bases:
+            for klass in base.__mro__:
+                if isinstance(klass, EntityMeta):
+                    inherited.update(klass._field_slots)
+                else:
+                    candidates.extend(k for k, v in vars(klass).items() if isinstance(v, FieldSpec))
+        candidates.extend(k for k, v in namespace.items() if isinstance(v, FieldSpec))
+
+        for field_name in candidates:
+            slot = f"_field_{field_name}"
+            if slot not in inherited and slot not in slots:
+                slots.append(slot)
+        return tuple(slots)
+
 
 class Entity(metaclass=EntityMeta):
     """Base entity class with field-based attribute management.
@@ -124,9 +253,15 @@ class Entity(metaclass=EntityMeta):
         ```
     """
 
+    __slots__ = ()
+
     # Type hints for instance attributes
     if t.TYPE_CHECKING:
         _fields: t.ClassVar[dict[str, FieldSpec[t.Any]]]
+        _field_names: t.ClassVar[tuple[str, ...]]
+        _field_slots: t.ClassVar[tuple[str, ...]]
+        _sortable_fields: t.ClassVar[frozenset[str]]
+        _nested_fields: t.ClassVar[frozenset[str]]
 
     def __init__(self, **kwargs: t.Any) -> None:
         """Initialize an entity with field values.
@@ -147,9 +282,8 @@ class Entity(metaclass=EntityMeta):
             )
             ```
         """
-        for field_name, _field in self._fields.items():
-            if field_name in kwargs:
-                setattr(self, field_name, kwargs[field_name])
+        for field_name in kwargs.keys() & self._fields.keys():
+            setattr(self, field_name, kwargs[field_name])
 
     def dumps(self) -> dict[str, t.Any]:
         """Convert entity to a dictionary.
@@ -176,10 +310,10 @@ class Entity(metaclass=EntityMeta):
             ```
         """
         result: dict[str, t.Any] = {}
-        for field_name in self._fields:
-            if hasattr(self, f"_field_{field_name}"):
-                value = getattr(self, field_name)
-                if isinstance(value, Entity):
+        for field_name, slot in zip(self._field_names, self._field_slots, strict=True):
+            value = getattr(self, slot, _MISSING)
+            if value is not _MISSING:
+                if field_name in self._nested_fields and isinstance(value, Entity):
                     value = value.dumps()
                 result[field_name] = value
         return result
@@ -201,9 +335,9 @@ class Entity(metaclass=EntityMeta):
             ```
         """
         attrs: list[str] = []
-        for field_name in self._fields:
-            if hasattr(self, f"_field_{field_name}"):
-                value = getattr(self, field_name)
+        for field_name, slot in zip(self._field_names, self._field_slots, strict=True):
+            value = getattr(self, slot, _MISSING)
+            if value is not _MISSING:
                 attrs.append(f"{field_name}={value!r}")
         return f"ENTITY <{self.__class__.__name__}({', '.join(attrs)})>"
 
@@ -234,10 +368,7 @@ class Entity(metaclass=EntityMeta):
             User.is_field_sortable("invalid")  # False
             ```
         """
-        field = cls._fields.get(field_name)
-        if field is None:
-            return False
-        return field.sortable
+        return field_name in cls._sortable_fields
 
 
 E = t.TypeVar("E", bound=Entity)
@@ -265,7 +396,7 @@ def is_field_sortable(entity: Entity, field_name: str) -> bool:
         is_field_sortable(user, "invalid")  # False
         ```
     """
-    return entity.__class__.is_field_sortable(field_name)
+    return field_name in type(entity)._sortable_fields
 
 
 class BaseEntity(Entity):
@@ -301,6 +432,9 @@ class BaseEntity(Entity):
     created_at: datetime.datetime = DateTimeField(default_factory=utils.utcnow, immutable=True)
     updated_at: datetime.datetime | None = DateTimeField(nullable=True)
 
+    if t.TYPE_CHECKING:
+        _field_id: str
+
     def touch(self) -> None:
         """Update the updated_at timestamp to the current time.
 
@@ -372,7 +506,12 @@ class BaseEntity(Entity):
         """
         if not isinstance(other, BaseEntity):
             return NotImplemented
-        return self.id == other.id
+        # Read the id slots directly; fall back to the descriptor only when
+        # an id has not been generated yet
+        try:
+            return self._field_id == other._field_id
+        except AttributeError:
+            return self.id == other.id
 
     def __hash__(self) -> int:
         """Compute hash based on entity ID.
@@ -395,26 +534,33 @@ class BaseEntity(Entity):
             print(user_dict[user1])  # "second" (user2 overwrote user1)
             ```
         """
-        return hash(self.id)
+        try:
+            return hash(self._field_id)
+        except AttributeError:
+            return hash(self.id)
 
 
 P = t.ParamSpec("P")
 R = t.TypeVar("R")
 
 
-class Touchable(t.Protocol):
-    """Protocol for entities that can be touched (have their timestamp
-    updated).
+if t.TYPE_CHECKING:
+    # Only a static bound for touch_after; it is never checked with
+    # isinstance, so it is not defined at runtime.
+    class Touchable(t.Protocol):
+        """Protocol for entities that can be touched (have their timestamp
+        updated).
 
-    This protocol defines the interface for entities that support
-    automatic timestamp updating through the touch() method.
-    """
-
-    def touch(self) -> None:
-        """Update the entity's timestamp."""
+        This protocol defines the interface for entities that support
+        automatic timestamp updating through the touch() method.
+        """
 
+        def touch(self) -> None:
+            """Update the entity's timestamp."""
 
-TT = t.TypeVar("TT", bound=Touchable)
+    TT = t.TypeVar("TT", bound=Touchable)
+else:
+    TT = t.TypeVar("TT")
 
 
 def touch_after(func: t.Callable[t.Concatenate[TT, P], R]) -> t.Callable[..., R]:
@@ -455,14 +601,20 @@ def touch_after(func: t.Callable[t.Concatenate[TT, P], R]) -> t.Callable[..., R]
         ```
     """
 
-    @ft.wraps(func)
-    def wrapper(self: TT, *args: P.args, **kwargs: P.kwargs) -> R:
-        try:
-            result = func(self, *args, **kwargs)
-        except Exception:
-            raise
-        else:
+    if len(inspect.signature(func).parameters) == 1:
+        # Most touching methods take only self, skip packing *args/**kwargs
+        @ft.wraps(func)
+        def bare_wrapper(self: TT) -> R:
+            result = func(self)  # type: ignore[call-arg]
             self.touch()
             return result
 
+        return bare_wrapper  # type: ignore[return-value]
+
+    @ft.wraps(func)
+    def wrapper(self: TT, *args: P.args, **kwargs: P.kwargs) -> R:
+        result = func(self, *args, **kwargs)
+        self.touch()
+        return result
+
     return wrapper  # type: ignore[return-value]
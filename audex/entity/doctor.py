@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools as ft
+
 from audex import utils
 from audex.entity import BaseEntity
 from audex.entity import touch_after
@@ -58,7 +60,7 @@ class Doctor(BaseEntity):
         ```
     """
 
-    id: str = StringField(default_factory=lambda: utils.gen_id(prefix="doctor-"))
+    id: str = StringField(default_factory=ft.partial(utils.gen_id, prefix="doctor-"))
     eid: str = StringField()
     password_hash: HashedPassword = StringBackedField(HashedPassword)
     name: str = StringField()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import datetime
+import sys
 import typing as t
 
 if t.TYPE_CHECKING:
@@ -10,6 +11,9 @@ if t.TYPE_CHECKING:
 
 T = t.TypeVar("T")
 
+# Marks an unset storage slot, since None is a valid field value
+_MISSING: t.Final = object()
+
 
 class FieldSpec(t.Generic[T]):
     """A descriptor for entity fields with validation and default value
@@ -24,6 +28,10 @@ class FieldSpec(t.Generic[T]):
         nullable: Whether the field can be None.
         immutable: Whether the field can be modified after initial assignment.
         sortable: Whether the field supports sorting operations.
+        nests_entities: Whether values of this field type can be nested
+            entities that `dumps()` has to serialize recursively.
+        default_sortable: Sortability of fields of this type when `sortable`
+            is not given.
         name: The public name of the field (set by __set_name__).
         private_name: The private attribute name for storing the value.
         _field_type: Stored type information for stub generation.
@@ -33,9 +41,25 @@ class FieldSpec(t.Generic[T]):
         default_factory: Callable that returns a default value.
         nullable: Whether None is allowed as a value.
         immutable: Whether the field can be modified after being set.
-        sortable: Whether the field supports sorting operations.
+        sortable: Whether the field supports sorting operations. Defaults
+            to `default_sortable` of the field type.
     """
 
+    __slots__ = (
+        "_field_type",
+        "_resolve_default",
+        "default",
+        "default_factory",
+        "immutable",
+        "name",
+        "nullable",
+        "private_name",
+        "sortable",
+    )
+
+    nests_entities: t.ClassVar[bool] = True
+    default_sortable: t.ClassVar[bool] = True
+
     def __init__(
         self,
         *,
@@ -43,16 +67,39 @@ class FieldSpec(t.Generic[T]):
         default_factory: t.Callable[[], T] | None = None,
         nullable: bool = False,
         immutable: bool = False,
-        sortable: bool = True,
+        sortable: bool | None = None,
     ) -> None:
         self.default = default
         self.default_factory = default_factory
         self.nullable = nullable
         self.immutable = immutable
-        self.sortable = sortable
+        self.sortable = self.default_sortable if sortable is None else sortable
         self.name: str = ""
         self.private_name: str = ""
         self._field_type: type | None = None  # Store type information
+        self._resolve_default = self._default_resolver()
+
+    def _default_resolver(self) -> t.Callable[[], T | None]:
+        """Pick the callable that produces the value of an unset field.
+
+        The choice only depends on the constructor arguments, so it is made
+        once instead of on every first read of the field.
+
+        Returns:
+            The default factory, a callable returning the default value or
+            None, or one raising AttributeError for required fields.
+        """
+        if self.default_factory is not None:
+            return self.default_factory
+        if self.default is not None:
+            default = self.default
+            return lambda: default
+        if self.nullable:
+            return lambda: None
+        return self._raise_unset
+
+    def _raise_unset(self) -> t.NoReturn:
+        raise AttributeError(f"Field '{self.name}' has not been set")
 
     def __set_name__(self, owner: type, name: str) -> None:
         """Set the field name when the descriptor is assigned to a class
@@ -63,7 +110,7 @@ class FieldSpec(t.Generic[T]):
             name: The name of the attribute.
         """
         self.name = name
-        self.private_name = f"_field_{name}"
+        self.private_name = sys.intern(f"_field_{name}")
 
     @t.overload
     def __get__(self, obj: None, objtype: type[t.Any] | None = None) -> t.Self: ...
@@ -74,22 +121,17 @@ class FieldSpec(t.Generic[T]):
         if obj is None:
             return self
 
-        if not hasattr(obj, self.private_name):
-            if self.default_factory is not None:
-                value = self.default_factory()
-            elif self.default is not None:
-                value = self.default
-            elif self.nullable:
-                value = None
-            else:
-                raise AttributeError(f"Field '{self.name}' has not been set")
-            setattr(obj, self.private_name, value)
+        private_name = self.private_name
+        value = getattr(obj, private_name, _MISSING)
+        if value is _MISSING:
+            value = self._resolve_default()
+            setattr(obj, private_name, value)
 
-        return t.cast(T, getattr(obj, self.private_name))
+        return t.cast(T, value)
 
     def __set__(self, obj: Entity, value: T) -> None:
         """Set the field value."""
-        if hasattr(obj, self.private_name) and self.immutable:
+        if self.immutable and getattr(obj, self.private_name, _MISSING) is not _MISSING:
             raise AttributeError(f"Field '{self.name}' is immutable")
 
         if value is None and not self.nullable:
@@ -101,7 +143,7 @@ class FieldSpec(t.Generic[T]):
         """Delete the field value."""
         if self.immutable:
             raise AttributeError(f"Field '{self.name}' is immutable")
-        if hasattr(obj, self.private_name):
+        if getattr(obj, self.private_name, _MISSING) is not _MISSING:
             delattr(obj, self.private_name)
 
 
@@ -112,6 +154,10 @@ class StringBackedFieldSpec(FieldSpec[T]):
     """A field descriptor for values that are persisted as strings in
     the database."""
 
+    __slots__ = ()
+
+    nests_entities = False
+
 
 @t.overload
 def StringBackedField(
@@ -157,22 +203,10 @@ def StringBackedField(
 class ListFieldSpec(FieldSpec[list[T]]):
     """A field descriptor for list/collection values."""
 
-    def __init__(
-        self,
-        *,
-        default: list[T] | None = None,
-        default_factory: t.Callable[[], list[T]] | None = None,
-        nullable: bool = False,
-        immutable: bool = False,
-        sortable: bool = False,
-    ) -> None:
-        super().__init__(
-            default=default,
-            default_factory=default_factory,
-            nullable=nullable,
-            immutable=immutable,
-            sortable=sortable,
-        )
+    __slots__ = ()
+
+    nests_entities = False
+    default_sortable = False
 
 
 @t.overload
@@ -219,22 +253,9 @@ def ListField(
 class ForeignFieldSpec(FieldSpec[T]):
     """A field descriptor for foreign/complex type values."""
 
-    def __init__(
-        self,
-        *,
-        default: T | None = None,
-        default_factory: t.Callable[[], T] | None = None,
-        nullable: bool = False,
-        immutable: bool = False,
-        sortable: bool = False,
-    ) -> None:
-        super().__init__(
-            default=default,
-            default_factory=default_factory,
-            nullable=nullable,
-            immutable=immutable,
-            sortable=sortable,
-        )
+    __slots__ = ()
+
+    default_sortable = False
 
 
 @t.overload
@@ -282,6 +303,10 @@ def ForeignField(
 class StringFieldSpec(FieldSpec[str]):
     """A field descriptor for string values."""
 
+    __slots__ = ()
+
+    nests_entities = False
+
 
 def StringField(
     *,
@@ -303,6 +328,10 @@ def StringField(
 class IntegerFieldSpec(FieldSpec[int]):
     """A field descriptor for integer values."""
 
+    __slots__ = ()
+
+    nests_entities = False
+
 
 def IntegerField(
     *,
@@ -324,6 +353,10 @@ def IntegerField(
 class FloatFieldSpec(FieldSpec[float]):
     """A field descriptor for float values."""
 
+    __slots__ = ()
+
+    nests_entities = False
+
 
 def FloatField(
     *,
@@ -345,6 +378,10 @@ def FloatField(
 class BoolFieldSpec(FieldSpec[bool]):
     """A field descriptor for boolean values."""
 
+    __slots__ = ()
+
+    nests_entities = False
+
 
 def BoolField(
     *,
@@ -366,6 +403,10 @@ def BoolField(
 class DateTimeFieldSpec(FieldSpec[datetime.datetime]):
     """A field descriptor for datetime values."""
 
+    __slots__ = ()
+
+    nests_entities = False
+
 
 def DateTimeField(
     *,
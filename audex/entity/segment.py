@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import functools as ft
 
 from audex import utils
 from audex.entity import BaseEntity
@@ -65,7 +66,7 @@ class Segment(BaseEntity):
         ```
     """
 
-    id: str = StringField(default_factory=lambda: utils.gen_id(prefix="segment-"))
+    id: str = StringField(default_factory=ft.partial(utils.gen_id, prefix="segment-"))
     session_id: str = StringField()
     sequence: int = IntegerField()
     audio_key: str = StringField()
@@ -95,12 +96,15 @@ class Segment(BaseEntity):
     def decr(self) -> None:
         """Decrement the sequence number of this segment by 1.
 
+        Raises:
+            ValueError: If the sequence number is already 1.
+
         Note:
             The updated_at timestamp is automatically updated.
         """
-        if self.sequence > 1:
-            self.sequence -= 1
-        raise ValueError("Sequence number cannot be less than 1.")
+        if self.sequence <= 1:
+            raise ValueError("Sequence number cannot be less than 1.")
+        self.sequence -= 1
 
     @touch_after
     def stop(self) -> None:
@@ -112,4 +116,6 @@ class Segment(BaseEntity):
         """
         if self.ended_at is None:
             self.ended_at = utils.utcnow()
-            self.duration_ms = int((self.ended_at - self.started_at).total_seconds() * 1000)
+            # Integer division is exact, unlike total_seconds() * 1000
+            elapsed = self.ended_at - self.started_at
+            self.duration_ms = elapsed // datetime.timedelta(milliseconds=1)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import functools as ft
 
 from audex import utils
 from audex.entity import BaseEntity
@@ -10,6 +11,8 @@ from audex.entity.fields import StringBackedField
 from audex.entity.fields import StringField
 from audex.valueobj.session import SessionStatus
 
+_FINISHED_STATUSES = frozenset({SessionStatus.COMPLETED, SessionStatus.CANCELLED})
+
 
 class Session(BaseEntity):
     """Session entity representing a doctor-patient conversation
@@ -65,7 +68,7 @@ class Session(BaseEntity):
         ```
     """
 
-    id: str = StringField(default_factory=lambda: utils.gen_id(prefix="session-"))
+    id: str = StringField(default_factory=ft.partial(utils.gen_id, prefix="session-"))
     doctor_id: str = StringField()
     patient_name: str | None = StringField(nullable=True)
     clinic_number: str | None = StringField(nullable=True)
@@ -92,7 +95,7 @@ class Session(BaseEntity):
         Returns:
             True if status is COMPLETED or CANCELLED, False otherwise.
         """
-        return self.status in (SessionStatus.COMPLETED, SessionStatus.CANCELLED)
+        return self.status in _FINISHED_STATUSES
 
     @touch_after
     def start(self) -> None:
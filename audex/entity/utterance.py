@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+import functools as ft
 
 from audex import utils
 from audex.entity import BaseEntity
@@ -83,7 +84,7 @@ class Utterance(BaseEntity):
         ```
     """
 
-    id: str = StringField(default_factory=lambda: utils.gen_id(prefix="utterance-"))
+    id: str = StringField(default_factory=ft.partial(utils.gen_id, prefix="utterance-"))
     session_id: str = StringField()
     segment_id: str = StringField()
     sequence: int = IntegerField()
@@ -134,9 +135,12 @@ class Utterance(BaseEntity):
     def decr(self) -> None:
         """Decrement the sequence number of this utterance by 1.
 
+        Raises:
+            ValueError: If the sequence number is already 1.
+
         Note:
             The updated_at timestamp is automatically updated.
         """
-        if self.sequence > 1:
-            self.sequence -= 1
-        raise ValueError("Sequence number cannot be less than 1.")
+        if self.sequence <= 1:
+            raise ValueError("Sequence number cannot be less than 1.")
+        self.sequence -= 1
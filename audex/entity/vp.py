@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools as ft
+
 from audex import utils
 from audex.entity import BaseEntity
 from audex.entity.fields import BoolField
@@ -58,7 +60,7 @@ class VP(BaseEntity):
         ```
     """
 
-    id: str = StringField(default_factory=lambda: utils.gen_id(prefix="vp_reg-"))
+    id: str = StringField(default_factory=ft.partial(utils.gen_id, prefix="vp_reg-"))
     doctor_id: str = StringField()
     vpr_uid: str = StringField()
     vpr_group_id: str = StringField()
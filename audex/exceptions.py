@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import typing as t
 
-import pydantic as pyd
+if t.TYPE_CHECKING:
+    import pydantic as pyd
 
 
 class AudexError(Exception):
@@ -18,6 +19,19 @@ class AudexError(Exception):
 
     default_message: t.ClassVar[str] = "An error occurred in Audex."
     code: t.ClassVar[int] = 0x01
+    _slot_names: t.ClassVar[tuple[str, ...]] = ("message",)
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        """Collect the slots of the whole hierarchy for `as_dict()`.
+
+        Subclasses only declare the slots they add, so the full list is
+        gathered once here, base classes first.
+        """
+        super().__init_subclass__(**kwargs)
+        names: dict[str, None] = {}
+        for klass in reversed(cls.__mro__):
+            names.update(dict.fromkeys(vars(klass).get("__slots__", ())))
+        cls._slot_names = tuple(names)
 
     def __init__(self, message: str | None = None) -> None:
         """Initialize the exception.
@@ -38,10 +52,7 @@ class AudexError(Exception):
 
     def as_dict(self) -> dict[str, t.Any]:
         """Convert exception to dictionary with all slots."""
-        data: dict[str, t.Any] = {}
-        for slot in getattr(self, "__slots__", []):
-            data[slot] = getattr(self, slot, None)
-        return data
+        return {slot: getattr(self, slot, None) for slot in self._slot_names}
 
 
 class InternalError(AudexError):
@@ -52,7 +63,7 @@ class InternalError(AudexError):
     support with the error code.
     """
 
-    __slots__ = ("details", "message")
+    __slots__ = ("details",)
 
     default_message = "Internal system error occurred"
     code: t.ClassVar[int] = 0x10
@@ -72,7 +83,7 @@ class InternalError(AudexError):
 class RequiredModuleNotFoundError(InternalError):
     """Exception raised when a required module is not found."""
 
-    __slots__ = ("details", "message", "module_name")
+    __slots__ = ("module_name",)
 
     default_message = "Required module not found"
     code: t.ClassVar[int] = 0x11
@@ -94,7 +105,7 @@ class RequiredModuleNotFoundError(InternalError):
 class ConfigurationError(InternalError):
     """Exception raised for configuration errors."""
 
-    __slots__ = ("config_key", "details", "message")
+    __slots__ = ("config_key", "reason")
 
     default_message = "Configuration error occurred"
     code: t.ClassVar[int] = 0x13
@@ -120,7 +131,7 @@ class ConfigurationError(InternalError):
 class ValidationError(AudexError):
     """Exception raised for validation errors."""
 
-    __slots__ = ("message", "reason")
+    __slots__ = ("reason",)
 
     default_message = "Validation failed"
     code: t.ClassVar[int] = 0x12
@@ -139,7 +150,9 @@ class ValidationError(AudexError):
     @classmethod
     def from_pydantic_validation_err(cls, err: pyd.ValidationError) -> t.Self:
         """Create ValidationError from a Pydantic ValidationError."""
-        reason = "; ".join(f"{e['loc']}: {e['msg']}" for e in err.errors())
+        # Only loc and msg are used, skip rendering urls, context and inputs
+        errors = err.errors(include_url=False, include_context=False, include_input=False)
+        reason = "; ".join([f"{e['loc']}: {e['msg']}" for e in errors])
         return cls(reason=reason)
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools as ft
 import typing as t
 
 from audex.valueobj.common.ops import Op
@@ -586,6 +587,36 @@ class ListFieldFilter(FieldFilter[list[T]]):
         return self._filter
 
 
+@ft.cache
+def _field_filter_classes(entity_class: type[Entity]) -> dict[str, type[FieldFilter[t.Any]]]:
+    """Map each field of an entity class to its field filter class.
+
+    Fields never change after class creation, so the mapping is resolved
+    once per entity class instead of on every builder attribute access.
+
+    Args:
+        entity_class: The entity class to resolve field filters for.
+
+    Returns:
+        A dictionary mapping field names to the FieldFilter subclass used
+        for that field.
+    """
+    from audex.entity.fields import ListFieldSpec as ListField
+    from audex.entity.fields import StringBackedFieldSpec as StringBackedField
+    from audex.entity.fields import StringFieldSpec as StringField
+
+    def filter_class(field: FieldSpec[t.Any]) -> type[FieldFilter[t.Any]]:
+        if isinstance(field, StringField):
+            return StringFieldFilter
+        if isinstance(field, StringBackedField):
+            return StringBackedFieldFilter
+        if isinstance(field, ListField):
+            return ListFieldFilter
+        return FieldFilter
+
+    return {name: filter_class(field) for name, field in entity_class._fields.items()}
+
+
 class FilterBuilder(t.Generic[E]):
     """Type-safe filter builder for entities.
 
@@ -654,25 +685,12 @@ class FilterBuilder(t.Generic[E]):
             raise AttributeError(f"'{type(self).__name__}' has no attribute '{name}'")
 
         entity_class: type[E] = object.__getattribute__(self, "_entity_class")
-        if name not in entity_class._fields:
+        filter_cls = _field_filter_classes(entity_class).get(name)
+        if filter_cls is None:
             raise AttributeError(f"Entity '{entity_class.__name__}' has no field '{name}'")
 
-        field: FieldSpec[t.Any] = entity_class._fields[name]
         filter_obj: Filter = object.__getattribute__(self, "_filter")
-
-        # Return appropriate filter type based on field type
-        from audex.entity.fields import ListFieldSpec as ListField
-        from audex.entity.fields import StringBackedFieldSpec as StringBackedField
-        from audex.entity.fields import StringFieldSpec as StringField
-
-        if isinstance(field, StringField):
-            return StringFieldFilter(name, filter_obj)
-        if isinstance(field, StringBackedField):
-            return StringBackedFieldFilter(name, filter_obj)
-        if isinstance(field, ListField):
-            return ListFieldFilter(name, filter_obj)
-
-        return FieldFilter(name, filter_obj)
+        return filter_cls(name, filter_obj)
 
     def __setattr__(self, name: str, value: t.Any) -> None:
         """Prevent attribute assignment to maintain immutability."""
@@ -80,6 +80,22 @@ class Settings(BaseSettings):
                 "files. Please install it using `pip install pyyaml`."
             ) from e
 
+    @classmethod
+    def from_json(cls, path: str | pathlib.Path | os.PathLike[str]) -> t.Self:
+        """Load configuration from JSON file.
+
+        The raw bytes are handed to pydantic-core, which parses and
+        validates them in one pass without building an intermediate
+        Python dict.
+
+        Args:
+            path: Path to JSON configuration file.
+
+        Returns:
+            Settings instance.
+        """
+        return cls.model_validate_json(pathlib.Path(path).read_bytes(), strict=False)
+
     # ============================================================================
     # Public Methods - Export
     # ============================================================================
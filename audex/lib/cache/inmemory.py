@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import collections
+import contextlib
 import time
 import typing as t
 
@@ -17,6 +18,9 @@ from audex.lib.cache import KVCache
 from audex.lib.cache import Negative
 from audex.lib.cache import T
 
+_KT = t.TypeVar("_KT", bound=t.Hashable)
+_VT = t.TypeVar("_VT")
+
 
 class TTLEntry:
     """Wrapper for cache entries with TTL information."""
@@ -41,6 +45,211 @@ class TTLEntry:
         return max(0, remaining)
 
 
+class FrequencySketch:
+    """Count-min sketch with 4-bit saturating counters.
+
+    Estimates how often a key has been seen recently. A doorkeeper set
+    absorbs the first occurrence of each key so one-hit wonders do not
+    pollute the counters, and every counter is halved once the number
+    of recorded accesses reaches ten times the sketch width, so old
+    popularity fades out.
+    """
+
+    __slots__ = ("_additions", "_doorkeeper", "_rows", "_sample_size", "width")
+
+    _SEEDS = (0x9E3779B9, 0x85EBCA6B, 0xC2B2AE35, 0x27D4EB2F)
+    _MAX_COUNT = 15
+
+    def __init__(self, width: int):
+        self.width = max(1, width)
+        self._rows = [bytearray(self.width) for _ in self._SEEDS]
+        self._doorkeeper: set[t.Hashable] = set()
+        self._sample_size = 10 * self.width
+        self._additions = 0
+
+    def _indexes(self, key: t.Hashable) -> t.Iterator[tuple[bytearray, int]]:
+        width = self.width
+        for row, seed in zip(self._rows, self._SEEDS, strict=True):
+            yield row, hash((seed, key)) % width
+
+    def increment(self, key: t.Hashable) -> None:
+        """Record one access to `key`."""
+        if key not in self._doorkeeper:
+            self._doorkeeper.add(key)
+        else:
+            for row, idx in self._indexes(key):
+                if row[idx] < self._MAX_COUNT:
+                    row[idx] += 1
+
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._reset()
+
+    def estimate(self, key: t.Hashable) -> int:
+        """Return the estimated access frequency of `key`."""
+        count = min(row[idx] for row, idx in self._indexes(key))
+        return count + 1 if key in self._doorkeeper else count
+
+    def _reset(self) -> None:
+        for i, row in enumerate(self._rows):
+            self._rows[i] = bytearray(count >> 1 for count in row)
+        self._doorkeeper.clear()
+        self._additions //= 2
+
+
+class TinyLFUCache(cachetools.Cache[_KT, _VT]):
+    """LRU cache guarded by a TinyLFU admission filter.
+
+    Every lookup is recorded in a `FrequencySketch`. When the cache is
+    full, a new key is only admitted if it has been requested more
+    often than the least recently used entry it would evict; otherwise
+    the write is dropped and the resident entry stays.
+
+    Args:
+        maxsize: Maximum number of items in cache.
+        sketch_width: Number of counters per row of the frequency sketch.
+    """
+
+    def __init__(self, maxsize: int, sketch_width: int):
+        super().__init__(maxsize)
+        self._order: collections.OrderedDict[_KT, None] = collections.OrderedDict()
+        self._sketch = FrequencySketch(sketch_width)
+
+    def __getitem__(self, key: _KT) -> _VT:
+        value = super().__getitem__(key)
+        self._order.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: _KT, value: _VT) -> None:
+        if key not in self:
+            self._sketch.increment(key)
+            if self._order and len(self) >= self.maxsize:
+                victim = next(iter(self._order))
+                if self._sketch.estimate(key) <= self._sketch.estimate(victim):
+                    return
+        super().__setitem__(key, value)
+        self._order[key] = None
+        self._order.move_to_end(key)
+
+    def __delitem__(self, key: _KT) -> None:
+        super().__delitem__(key)
+        del self._order[key]
+
+    def get(self, key: _KT, default: t.Any = None) -> t.Any:
+        self._sketch.increment(key)
+        return super().get(key, default)
+
+    def popitem(self) -> tuple[_KT, _VT]:
+        """Remove and return the least recently used `(key, value)`
+        pair."""
+        try:
+            key = next(iter(self._order))
+        except StopIteration:
+            raise KeyError(f"{type(self).__name__} is empty") from None
+        return (key, self.pop(key))
+
+    def clear(self) -> None:
+        super().clear()
+        self._order.clear()
+
+
+class ClockCache(cachetools.Cache[_KT, _VT]):
+    """CLOCK cache, with optional WSCLOCK working-set aging.
+
+    Keys live in a fixed ring of `maxsize` slots with one reference bit
+    each. A hit only sets the bit, so the recency order never has to be
+    rewired. To evict, the clock hand sweeps the ring, clearing set bits
+    and taking the first slot whose bit is already clear.
+
+    With `working_set` given, an unreferenced slot is only taken when it
+    has not been used for `working_set` seconds; if every entry is still
+    in the working set, the first unreferenced one seen is evicted.
+
+    Args:
+        maxsize: Maximum number of items in cache.
+        working_set: Working-set window in seconds for WSCLOCK, or None
+            for plain CLOCK.
+    """
+
+    _FREE: t.Final = object()
+
+    def __init__(self, maxsize: int, working_set: float | None = None):
+        super().__init__(maxsize)
+        self._working_set = working_set
+        self._keys: list[t.Any] = [self._FREE] * maxsize
+        self._referenced = bytearray(maxsize)
+        self._last_used = [0.0] * maxsize
+        self._slots: dict[_KT, int] = {}
+        self._free = list(range(maxsize - 1, -1, -1))
+        self._hand = 0
+
+    def __getitem__(self, key: _KT) -> _VT:
+        value = super().__getitem__(key)
+        self._touch(self._slots[key])
+        return value
+
+    def __setitem__(self, key: _KT, value: _VT) -> None:
+        super().__setitem__(key, value)
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._touch(slot)
+            return
+        # New entries start unreferenced so only later hits protect them
+        slot = self._free.pop()
+        self._keys[slot] = key
+        self._slots[key] = slot
+        self._last_used[slot] = time.monotonic()
+
+    def __delitem__(self, key: _KT) -> None:
+        super().__delitem__(key)
+        slot = self._slots.pop(key)
+        self._keys[slot] = self._FREE
+        self._referenced[slot] = 0
+        self._free.append(slot)
+
+    def _touch(self, slot: int) -> None:
+        self._referenced[slot] = 1
+        if self._working_set is not None:
+            self._last_used[slot] = time.monotonic()
+
+    def popitem(self) -> tuple[_KT, _VT]:
+        """Remove and return the `(key, value)` pair under the clock
+        hand."""
+        if not self._slots:
+            raise KeyError(f"{type(self).__name__} is empty")
+
+        size = len(self._keys)
+        now = time.monotonic()
+        fallback: _KT | None = None
+        # Two revolutions are enough: the first one clears every bit
+        for _ in range(2 * size):
+            slot = self._hand
+            self._hand = (slot + 1) % size
+            key = self._keys[slot]
+            if key is self._FREE:
+                continue
+            if self._referenced[slot]:
+                self._referenced[slot] = 0
+                continue
+            if self._working_set is None or now - self._last_used[slot] > self._working_set:
+                return (key, self.pop(key))
+            if fallback is None:
+                fallback = key
+        # Every entry is unreferenced on the second revolution, so a
+        # non-empty ring always leaves a fallback
+        key = t.cast(_KT, fallback)
+        return (key, self.pop(key))
+
+    def clear(self) -> None:
+        super().clear()
+        size = len(self._keys)
+        self._keys = [self._FREE] * size
+        self._referenced = bytearray(size)
+        self._slots.clear()
+        self._free = list(range(size - 1, -1, -1))
+        self._hand = 0
+
+
 class InmemoryCache(KVCache):
     __logtag__ = "audex.lib.cache.inmemory"
 
@@ -48,19 +257,32 @@ class InmemoryCache(KVCache):
         self,
         *,
         key_builder: KeyBuilder,
-        cache_type: t.Literal["lru", "lfu", "ttl", "fifo"] = "lru",
+        cache_type: t.Literal["lru", "lfu", "ttl", "fifo", "tinylfu", "clock", "wsclock"] = "lru",
         maxsize: int = 1000,
         default_ttl: int = 300,
         negative_ttl: int = 60,
+        sketch_width: int | None = None,
+        working_set: int | None = None,
+        purge_interval: float = 60.0,
+        purge_batch: int = 1024,
     ) -> None:
         """Initialize InmemoryCache.
 
         Args:
             key_builder: KeyBuilder instance for building cache keys
-            cache_type: Type of cache strategy ('lru', 'lfu', 'ttl', 'fifo')
+            cache_type: Type of cache strategy ('lru', 'lfu', 'ttl', 'fifo',
+                'tinylfu', 'clock', 'wsclock')
             maxsize: Maximum number of items in cache
             default_ttl: Default TTL in seconds for cache entries
             negative_ttl: TTL in seconds for negative cache entries
+            sketch_width: Width of the TinyLFU frequency sketch, defaults
+                to ten times `maxsize`. Only used by 'tinylfu'.
+            working_set: Working-set window in seconds, defaults to
+                `default_ttl`. Only used by 'wsclock'.
+            purge_interval: Seconds between background sweeps for expired
+                entries. Expired entries are never returned, but may hold
+                memory for up to this long.
+            purge_batch: Maximum number of entries inspected per sweep.
         """
         super().__init__()
         self._key_builder = key_builder
@@ -68,11 +290,17 @@ class InmemoryCache(KVCache):
         self.maxsize = maxsize
         self.default_ttl = default_ttl
         self.negative_ttl = negative_ttl
+        self.purge_interval = purge_interval
+        self.purge_batch = purge_batch
         self.logger.info("Initializing Cachetools cache")
 
         # Thread lock for thread-safe operations (async lock)
         self._lock = asyncio.Lock()
 
+        # Background sweep state, see `_purge_loop()`
+        self._purge_task: asyncio.Task[None] | None = None
+        self._purge_cursor: t.Iterator[str] = iter(())
+
         # Initialize the appropriate cache type
         self._cache: t.MutableMapping[str, TTLEntry]
         if cache_type == "lru":
@@ -85,6 +313,21 @@ class InmemoryCache(KVCache):
             cache_ttl = default_ttl
             self._cache = cachetools.TTLCache(maxsize=maxsize, ttl=cache_ttl)
             self.logger.info(f"Initialized TTL cache with maxsize={maxsize}, ttl={cache_ttl}")
+        elif cache_type == "tinylfu":
+            width = sketch_width or maxsize * 10
+            self._cache = TinyLFUCache(maxsize=maxsize, sketch_width=width)
+            self.logger.info(
+                f"Initialized TinyLFU cache with maxsize={maxsize}, sketch_width={width}"
+            )
+        elif cache_type == "clock":
+            self._cache = ClockCache(maxsize=maxsize)
+            self.logger.info(f"Initialized CLOCK cache with maxsize={maxsize}")
+        elif cache_type == "wsclock":
+            window = working_set or default_ttl
+            self._cache = ClockCache(maxsize=maxsize, working_set=window)
+            self.logger.info(
+                f"Initialized WSCLOCK cache with maxsize={maxsize}, working_set={window}"
+            )
         elif cache_type == "fifo":
             # Cachetools doesn't have built-in FIFO, use OrderedDict wrapper
             self._cache = collections.OrderedDict()
@@ -120,8 +363,9 @@ class InmemoryCache(KVCache):
             return
 
         expired_keys = []
-        for key, entry in self._cache.items():
-            if entry.is_expired():
+        for key in list(self._cache):
+            entry = self._peek(key)
+            if entry is not None and entry.is_expired():
                 expired_keys.append(key)
 
         for key in expired_keys:
@@ -131,6 +375,50 @@ class InmemoryCache(KVCache):
             except KeyError:
                 pass
 
+    def _peek(self, key: str) -> TTLEntry | None:
+        """Return the entry for `key` without recording an access.
+
+        `get()` counts as a hit for the eviction policy (LRU order,
+        CLOCK reference bits, LFU and TinyLFU frequencies), so internal
+        scans read through the base mapping instead.
+        """
+        if isinstance(self._cache, cachetools.Cache):
+            try:
+                entry: TTLEntry = cachetools.Cache.__getitem__(self._cache, key)
+            except KeyError:
+                return None
+            return entry
+        return self._cache.get(key)
+
+    async def _purge_expired(self) -> None:
+        """Remove expired entries among the next `purge_batch` keys.
+
+        Walks a snapshot of the keys across calls, so the whole cache
+        is covered every `len(cache) / purge_batch` sweeps.
+        """
+        checked = 0
+        while checked < self.purge_batch:
+            key = next(self._purge_cursor, None)
+            if key is None:
+                if checked == 0 and self._cache:
+                    self._purge_cursor = iter(list(self._cache.keys()))
+                    continue
+                break
+            checked += 1
+            entry = self._peek(key)
+            if entry is not None and entry.is_expired():
+                del self._cache[key]
+                self.logger.debug(f"Purged expired entry: {key}")
+
+    async def _purge_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.purge_interval)
+            async with self._lock:
+                try:
+                    await self._purge_expired()
+                except Exception as e:
+                    self.logger.warning(f"Failed to purge expired entries: {e}")
+
     async def set_negative(self, key: str, /) -> None:
         """Store cache miss marker to prevent cache penetration."""
         async with self._lock:
@@ -145,7 +433,6 @@ class InmemoryCache(KVCache):
     async def get_item(self, key: str) -> VT | Empty | Negative:
         async with self._lock:
             try:
-                await self._cleanup_expired()
                 entry = self._cache.get(key)
 
                 if entry is None:
@@ -228,7 +515,6 @@ class InmemoryCache(KVCache):
             return False
         async with self._lock:
             try:
-                await self._cleanup_expired()
                 if key not in self._cache:
                     return False
 
@@ -265,7 +551,6 @@ class InmemoryCache(KVCache):
         """Get value or set and return default if key doesn't exist."""
         async with self._lock:
             try:
-                await self._cleanup_expired()
                 entry = self._cache.get(key)
 
                 if entry is not None and not entry.is_expired():
@@ -313,7 +598,6 @@ class InmemoryCache(KVCache):
         """Remove and return value, or return default if not found."""
         async with self._lock:
             try:
-                await self._cleanup_expired()
                 entry = self._cache.get(key)
 
                 if entry is not None and not entry.is_expired():
@@ -333,8 +617,6 @@ class InmemoryCache(KVCache):
         """Remove and return an arbitrary (key, value) pair."""
         async with self._lock:
             try:
-                await self._cleanup_expired()
-
                 for key in list(self._cache.keys()):
                     if not self.key_builder.validate(key):
                         continue
@@ -429,7 +711,6 @@ class InmemoryCache(KVCache):
         """Increment a key's value."""
         async with self._lock:
             try:
-                await self._cleanup_expired()
                 entry = self._cache.get(key)
 
                 if entry is None or entry.is_expired():
@@ -465,12 +746,12 @@ class InmemoryCache(KVCache):
         """Return all cache values."""
         async with self._lock:
             try:
-                await self._cleanup_expired()
                 values = []
-                for key, entry in self._cache.items():
+                for key in list(self._cache):
                     if not self.key_builder.validate(key):
                         continue
-                    if entry.is_expired():
+                    entry = self._peek(key)
+                    if entry is None or entry.is_expired():
                         continue
                     if isinstance(entry.value, CacheMiss):
                         continue
@@ -484,12 +765,12 @@ class InmemoryCache(KVCache):
         """Return all cache items as (key, value) pairs."""
         async with self._lock:
             try:
-                await self._cleanup_expired()
                 items = []
-                for key, entry in self._cache.items():
+                for key in list(self._cache):
                     if not self.key_builder.validate(key):
                         continue
-                    if entry.is_expired():
+                    entry = self._peek(key)
+                    if entry is None or entry.is_expired():
                         continue
                     if isinstance(entry.value, CacheMiss):
                         continue
@@ -501,10 +782,18 @@ class InmemoryCache(KVCache):
 
     async def init(self) -> None:
         """Initialize cache resources if needed."""
+        # TTLCache expires entries by itself
+        if self.cache_type != "ttl" and self._purge_task is None:
+            self._purge_task = asyncio.create_task(self._purge_loop())
         self.logger.info("InmemoryCache initialized")
 
     async def close(self) -> None:
         """Close cache and cleanup resources."""
+        if self._purge_task is not None:
+            self._purge_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._purge_task
+            self._purge_task = None
         async with self._lock:
             try:
                 self._cache.clear()
@@ -29,6 +29,12 @@ class SQLitePoolConfig(t.TypedDict):
     pool_pre_ping: bool
     """Test connections before using them."""
 
+    pool_use_lifo: bool
+    """Reuse the most recently returned connection first."""
+
+    busy_timeout: float
+    """Seconds to wait on a locked database before failing."""
+
     create_all: bool
     """Whether to create all tables on init."""
 
@@ -47,12 +53,13 @@ class SQLite(Database):
 
     Attributes:
         uri: SQLite connection URI.
+        url: Parsed SQLite connection URL.
         engine: SQLAlchemy async engine (initialized after init()).
         sessionmaker: Async session factory (initialized after init()).
         cfg: Connection pool configuration.
 
     Args:
-        uri: SQLite connection URI (must use aiosqlite driver).
+        uri: SQLite connection URI or parsed URL (must use aiosqlite driver).
             Example: "sqlite+aiosqlite:///./database.db" (relative path)
             Example: "sqlite+aiosqlite:////absolute/path/database.db" (absolute
                 path)
@@ -61,13 +68,18 @@ class SQLite(Database):
             create_all/drop_all.
         echo: Whether to log all SQL statements (useful for debugging).
         pool_size: Number of connections to maintain in the pool.
-            Note: SQLite with aiosqlite uses NullPool by default in async mode.
+            Ignored for in-memory databases, which share one connection.
         max_overflow: Max number of connections beyond pool_size.
         pool_timeout: Seconds to wait before timing out on connection.
         pool_recycle: Seconds after which to recycle connections.
             Set to -1 to disable recycling.
         pool_pre_ping: Test connections before using them. Recommended
             for production to handle stale connections.
+        pool_use_lifo: Hand out the most recently returned connection
+            first, so a small set of warm connections serves most
+            requests and idle ones can be recycled.
+        busy_timeout: Seconds a connection waits on a locked database
+            before raising.
         create_all: Whether to create all tables on init().
 
     Example:
@@ -117,7 +129,7 @@ class SQLite(Database):
 
     def __init__(
         self,
-        uri: str,
+        uri: str | sa.URL,
         *,
         tables: list[type[sqlm.SQLModel]] | None = None,
         echo: bool = False,
@@ -126,9 +138,12 @@ class SQLite(Database):
         pool_timeout: float = 30.0,
         pool_recycle: int = 3600,
         pool_pre_ping: bool = True,
+        pool_use_lifo: bool = True,
+        busy_timeout: float = 5.0,
         create_all: bool = True,
     ) -> None:
-        self.uri = uri
+        self.url = sa.make_url(uri)
+        self.uri = self.url.render_as_string(hide_password=False)
         self.tables = tables or []
         self.engine: aiosa.AsyncEngine | None = None
         self.sessionmaker: aiosa.async_sessionmaker[aiosa.AsyncSession] | None = None
@@ -139,6 +154,8 @@ class SQLite(Database):
             pool_timeout=pool_timeout,
             pool_recycle=pool_recycle,
             pool_pre_ping=pool_pre_ping,
+            pool_use_lifo=pool_use_lifo,
+            busy_timeout=busy_timeout,
             create_all=create_all,
         )
 
@@ -156,16 +173,34 @@ class SQLite(Database):
             Exception: If engine creation fails (e.g., invalid URI).
         """
         # Create engine with SQLite-specific configuration
-        self.engine = aiosa.create_async_engine(
-            self.uri,
-            echo=self.cfg["echo"],
-            # SQLite-specific: Use NullPool for better async compatibility
-            # or StaticPool for in-memory databases
-            poolclass=sa.pool.NullPool if ":memory:" not in self.uri else sa.pool.StaticPool,
-            connect_args={
-                "check_same_thread": False,  # Required for async SQLite
-            },
-        )
+        connect_args = {
+            "check_same_thread": False,  # Required for async SQLite
+            "timeout": self.cfg["busy_timeout"],
+        }
+        if ":memory:" in self.uri:
+            # In-memory databases only live as long as their connection,
+            # so every session has to share a single one
+            self.engine = aiosa.create_async_engine(
+                self.url,
+                echo=self.cfg["echo"],
+                poolclass=sa.pool.StaticPool,
+                connect_args=connect_args,
+            )
+        else:
+            # Keep connections open across sessions so the connect-time
+            # pragmas below run once per connection, not once per session
+            self.engine = aiosa.create_async_engine(
+                self.url,
+                echo=self.cfg["echo"],
+                poolclass=sa.pool.AsyncAdaptedQueuePool,
+                pool_size=self.cfg["pool_size"],
+                max_overflow=self.cfg["max_overflow"],
+                pool_timeout=self.cfg["pool_timeout"],
+                pool_recycle=self.cfg["pool_recycle"],
+                pool_pre_ping=self.cfg["pool_pre_ping"],
+                pool_use_lifo=self.cfg["pool_use_lifo"],
+                connect_args=connect_args,
+            )
 
         # Configure SQLite settings
         @saevent.listens_for(self.engine.sync_engine, "connect")
@@ -22,4 +22,8 @@ def make_cache(config: Config) -> KVCache:
         maxsize=config.infrastructure.cache.inmemory.max_size,
         default_ttl=config.infrastructure.cache.inmemory.default_ttl,
         negative_ttl=config.infrastructure.cache.inmemory.negative_ttl,
+        sketch_width=config.infrastructure.cache.inmemory.sketch_width,
+        working_set=config.infrastructure.cache.inmemory.working_set,
+        purge_interval=config.infrastructure.cache.inmemory.purge_interval,
+        purge_batch=config.infrastructure.cache.inmemory.purge_batch,
     )
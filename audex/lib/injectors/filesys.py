@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import os
+
 from audex.config import Config
 from audex.lib.filesys import FileSystemManager
 
 
 def make_filesys(config: Config) -> FileSystemManager:
-    log_paths = [
+    log_paths: list[str | os.PathLike[str]] = [
         target.logname
         for target in config.core.logging.targets
-        if target.logname not in ("stderr", "stdout")
+        if not isinstance(target.logname, str)
     ]
     return FileSystemManager(
         store_path=config.infrastructure.store.base_url,
@@ -12,7 +12,7 @@ def make_sqlite(config: Config) -> SQLite:
     from audex.lib.repos.tables import TABLES
 
     return SQLite(
-        uri=config.infrastructure.sqlite.uri,
+        uri=config.infrastructure.sqlite.url,
         tables=list(TABLES),
         echo=config.infrastructure.sqlite.echo,
         pool_size=config.infrastructure.sqlite.pool_size,
@@ -20,5 +20,7 @@ def make_sqlite(config: Config) -> SQLite:
         pool_recycle=config.infrastructure.sqlite.pool_recycle,
         pool_timeout=config.infrastructure.sqlite.pool_timeout,
         pool_pre_ping=config.infrastructure.sqlite.pool_pre_ping,
+        pool_use_lifo=config.infrastructure.sqlite.pool_use_lifo,
+        busy_timeout=config.infrastructure.sqlite.busy_timeout,
         create_all=config.infrastructure.sqlite.create_all,
     )
@@ -23,7 +23,7 @@ class InternalDoctorServiceError(InternalError):
 class DoctorNotFoundError(DoctorServiceError):
     """Raised when doctor is not found."""
 
-    __slots__ = ("doctor_id", "message")
+    __slots__ = ("doctor_id",)
 
     default_message = "Doctor not found"
     code: t.ClassVar[int] = 0x32
@@ -42,7 +42,7 @@ class DoctorNotFoundError(DoctorServiceError):
 class InvalidCredentialsError(DoctorServiceError):
     """Raised for invalid login credentials."""
 
-    __slots__ = ("message", "reason")
+    __slots__ = ("reason",)
 
     default_message = "Invalid credentials"
     code: t.ClassVar[int] = 0x33
@@ -61,7 +61,7 @@ class InvalidCredentialsError(DoctorServiceError):
 class VoiceprintNotFoundError(DoctorServiceError):
     """Raised when voiceprint is not found."""
 
-    __slots__ = ("doctor_id", "message")
+    __slots__ = ("doctor_id",)
 
     default_message = "Voiceprint not found"
     code: t.ClassVar[int] = 0x34
@@ -80,7 +80,7 @@ class VoiceprintNotFoundError(DoctorServiceError):
 class DuplicateEIDError(DoctorServiceError):
     """Raised when trying to register with an existing EID."""
 
-    __slots__ = ("eid", "message")
+    __slots__ = ("eid",)
 
     default_message = "Duplicate EID"
     code: t.ClassVar[int] = 0x35
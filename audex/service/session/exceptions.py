@@ -23,7 +23,7 @@ class InternalSessionServiceError(InternalError):
 class SessionNotFoundError(SessionServiceError):
     """Raised when session is not found."""
 
-    __slots__ = ("message", "session_id")
+    __slots__ = ("session_id",)
 
     default_message = "Session not found"
     code: t.ClassVar[int] = 0x42
@@ -43,7 +43,7 @@ class SessionNotFoundError(SessionServiceError):
 class SegmentNotFoundError(SessionServiceError):
     """Raised when segment is not found."""
 
-    __slots__ = ("message", "segment_id")
+    __slots__ = ("segment_id",)
 
     default_message = "Segment not found"
     code: t.ClassVar[int] = 0x43
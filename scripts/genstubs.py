@@ -365,6 +365,10 @@ def get_entity_methods(entity_class: type[BaseEntity]) -> list[tuple[str, inspec
         ):
             continue
 
+        # Skip methods generated by EntityMeta, they mirror the base ones
+        if getattr(method, "__entity_generated__", False):
+            continue
+
         # Only include methods defined in this class
         if method.__qualname__.split(".")[0] != entity_class.__name__:
             continue
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from pydantic import ValidationError
+import pytest
+
+from audex.config.infrastructure.database import SQLiteConfig
+
+
+class TestSQLiteConfigURL:
+    """Test the parsed database URL."""
+
+    def test_url_matches_uri(self) -> None:
+        """Test the URL is parsed from the configured URI."""
+        config = SQLiteConfig(uri="sqlite+aiosqlite:///./first.db")
+        assert config.url.database == "./first.db"
+
+    def test_invalid_uri_fails_validation(self) -> None:
+        """Test a malformed URI is rejected at load time."""
+        with pytest.raises(ValidationError):
+            SQLiteConfig(uri="not a uri")
+
+    def test_model_copy_updates_url(self) -> None:
+        """Test a copy with another URI does not reuse the old URL."""
+        config = SQLiteConfig(uri="sqlite+aiosqlite:///./first.db")
+        assert config.url.database == "./first.db"
+
+        copied = config.model_copy(update={"uri": "sqlite+aiosqlite:///./second.db"})
+
+        assert copied.url.database == "./second.db"
+        assert config.url.database == "./first.db"
+
+    def test_assignment_updates_url(self) -> None:
+        """Test assigning a new URI is reflected in the URL."""
+        config = SQLiteConfig(uri="sqlite+aiosqlite:///./first.db")
+        assert config.url.database == "./first.db"
+
+        config.uri = "sqlite+aiosqlite:///./second.db"
+
+        assert config.url.database == "./second.db"
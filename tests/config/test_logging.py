@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from audex.config.core.logging import LoggingConfig
+from audex.config.core.logging import SizeBasedRotation
+
+
+def _file_rotation(config: LoggingConfig) -> SizeBasedRotation:
+    """Return the size-based rotation of the default file target."""
+    rotation = config.targets[2].rotation
+    assert rotation is not None
+    assert rotation.size_based is not None
+    return rotation.size_based
+
+
+class TestLoggingConfigDefaults:
+    """Test the default logging targets."""
+
+    def test_default_targets(self) -> None:
+        """Test the default targets are stdout, stderr and a rotated file."""
+        config = LoggingConfig()
+        assert [target.logname for target in config.targets[:2]] == ["stdout", "stderr"]
+        assert [target.loglevel for target in config.targets] == ["DEBUG", "ERROR", "INFO"]
+        assert _file_rotation(config).max_size == 10
+
+    def test_defaults_match_validated_form(self) -> None:
+        """Test the constructed defaults dump like validated targets."""
+        config = LoggingConfig()
+        validated = LoggingConfig.model_validate({
+            "targets": [
+                {"logname": "stdout", "loglevel": "debug"},
+                {"logname": "stderr", "loglevel": "error"},
+                {"logname": "logs/audex.jsonl", "rotation": {"size_based": {}}},
+            ]
+        })
+
+        assert config.model_dump() == validated.model_dump()
+        assert all(type(target.logname) is str for target in config.targets[:2])
+
+    def test_instances_do_not_share_targets(self) -> None:
+        """Test each config gets its own targets, down to nested models."""
+        first = LoggingConfig()
+        second = LoggingConfig()
+
+        assert first.targets is not second.targets
+        assert first.targets[0] is not second.targets[0]
+        assert first.targets[2].rotation is not second.targets[2].rotation
+        assert _file_rotation(first) is not _file_rotation(second)
+
+    def test_mutating_rotation_does_not_leak(self) -> None:
+        """Test editing one config's rotation leaves other configs alone."""
+        _file_rotation(LoggingConfig()).max_size = 99
+
+        assert _file_rotation(LoggingConfig()).max_size == 10
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pathlib
+import typing as t
+
+from pydantic_settings import SettingsConfigDict
+import pytest
+
+from audex.config.settings import Config
+
+
+class OtherConfig(Config):
+    model_config: t.ClassVar[SettingsConfigDict] = SettingsConfigDict(env_prefix="OTHER__")
+
+
+class TestConfigSources:
+    """Test where Config reads its values from."""
+
+    @pytest.fixture(autouse=True)
+    def _environ(self, monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path) -> None:
+        """Run without a dotenv file and with distinct values per prefix."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("AUDEX__CORE__APP__APP_NAME", "audex-env")
+        monkeypatch.setenv("OTHER__CORE__APP__APP_NAME", "other-env")
+
+    def test_reads_prefixed_environment(self) -> None:
+        """Test values are read from AUDEX__ variables."""
+        assert Config().core.app.app_name == "audex-env"
+
+    def test_env_prefix_override(self) -> None:
+        """Test an explicit `_env_prefix` reads its own variables."""
+        Config()
+        config = Config(_env_prefix="OTHER__")  # type: ignore[call-arg]
+        assert config.core.app.app_name == "other-env"
+
+    def test_subclass_prefix_is_isolated(self) -> None:
+        """Test a subclass with another prefix does not affect Config."""
+        assert OtherConfig().core.app.app_name == "other-env"
+        assert Config().core.app.app_name == "audex-env"
+
+    def test_environment_changes_are_seen(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a changed variable is picked up by the next Config."""
+        Config()
+        monkeypatch.setenv("AUDEX__CORE__APP__APP_NAME", "changed")
+        assert Config().core.app.app_name == "changed"
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import pytest
+
+from audex.entity.segment import Segment
+
+
+def _make_segment(sequence: int) -> Segment:
+    """Build a segment with the given sequence number."""
+    return Segment(session_id="session-1", sequence=sequence, audio_key="audio-1")
+
+
+class TestSegmentDecr:
+    """Test decrementing the segment sequence number."""
+
+    def test_decrements_sequence(self) -> None:
+        """Test the sequence number drops by one and updated_at is set."""
+        segment = _make_segment(3)
+
+        segment.decr()
+
+        assert segment.sequence == 2
+        assert segment.updated_at is not None
+
+    def test_raises_at_one(self) -> None:
+        """Test the sequence number cannot go below 1."""
+        segment = _make_segment(1)
+
+        with pytest.raises(ValueError):
+            segment.decr()
+
+        assert segment.sequence == 1
+
+    def test_failed_decr_keeps_updated_at(self) -> None:
+        """Test a rejected decrement does not touch updated_at."""
+        segment = _make_segment(2)
+        segment.decr()
+        updated_at = segment.updated_at
+
+        with pytest.raises(ValueError):
+            segment.decr()
+
+        assert segment.sequence == 1
+        assert segment.updated_at == updated_at
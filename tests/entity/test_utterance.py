@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+
+from audex.entity.utterance import Utterance
+from audex.valueobj.utterance import Speaker
+
+
+def _make_utterance(sequence: int) -> Utterance:
+    """Build an utterance with the given sequence number."""
+    return Utterance(
+        session_id="session-1",
+        segment_id="segment-1",
+        sequence=sequence,
+        speaker=Speaker.DOCTOR,
+        text="hello",
+        start_time_ms=0,
+        end_time_ms=1000,
+    )
+
+
+class TestUtteranceDecr:
+    """Test decrementing the utterance sequence number."""
+
+    def test_decrements_sequence(self) -> None:
+        """Test the sequence number drops by one and updated_at is set."""
+        utterance = _make_utterance(3)
+
+        utterance.decr()
+
+        assert utterance.sequence == 2
+        assert utterance.updated_at is not None
+
+    def test_raises_at_one(self) -> None:
+        """Test the sequence number cannot go below 1."""
+        utterance = _make_utterance(1)
+
+        with pytest.raises(ValueError):
+            utterance.decr()
+
+        assert utterance.sequence == 1
+
+    def test_failed_decr_keeps_updated_at(self) -> None:
+        """Test a rejected decrement does not touch updated_at."""
+        utterance = _make_utterance(2)
+        utterance.decr()
+        updated_at = utterance.updated_at
+
+        with pytest.raises(ValueError):
+            utterance.decr()
+
+        assert utterance.sequence == 1
+        assert utterance.updated_at == updated_at
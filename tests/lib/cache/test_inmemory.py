@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import time
+import typing as t
+
+import pytest
+
+from audex.lib.cache import KeyBuilder
+from audex.lib.cache.inmemory import ClockCache
+from audex.lib.cache.inmemory import FrequencySketch
+from audex.lib.cache.inmemory import InmemoryCache
+from audex.lib.cache.inmemory import TinyLFUCache
+
+
+def _make_cache(
+    cache_type: t.Literal["lru", "tinylfu", "clock", "wsclock"], maxsize: int = 2
+) -> InmemoryCache:
+    """Build an in-memory cache of the given type."""
+    return InmemoryCache(
+        key_builder=KeyBuilder(prefix="test"),
+        cache_type=cache_type,
+        maxsize=maxsize,
+    )
+
+
+class TestFrequencySketch:
+    """Test the TinyLFU frequency sketch."""
+
+    def test_doorkeeper_absorbs_first_access(self) -> None:
+        """Test the first access only reaches the doorkeeper."""
+        sketch = FrequencySketch(width=64)
+        sketch.increment("a")
+        assert sketch.estimate("a") == 1
+        assert not any(any(row) for row in sketch._rows)
+
+    def test_counters_halve_at_sample_size(self) -> None:
+        """Test every counter is halved and the doorkeeper cleared once
+        the sample size is reached."""
+        sketch = FrequencySketch(width=64)
+        for _ in range(10 * 64 - 1):
+            sketch.increment("a")
+        assert sketch.estimate("a") == 16
+
+        sketch.increment("a")
+
+        assert sketch.estimate("a") == 7
+        assert "a" not in sketch._doorkeeper
+        assert sketch._additions == 10 * 64 // 2
+
+
+class TestTinyLFUCache:
+    """Test the TinyLFU admission policy."""
+
+    def test_rejects_less_frequent_candidate(self) -> None:
+        """Test a cold key is not admitted over a hotter resident."""
+        cache: TinyLFUCache[str, int] = TinyLFUCache(maxsize=2, sketch_width=64)
+        cache["a"] = 1
+        cache["b"] = 2
+        for _ in range(3):
+            cache.get("a")
+
+        cache["c"] = 3
+
+        assert "c" not in cache
+        assert set(cache) == {"a", "b"}
+
+    def test_admits_candidate_and_evicts_lru_victim(self) -> None:
+        """Test a key requested more often than the LRU entry replaces
+        it."""
+        cache: TinyLFUCache[str, int] = TinyLFUCache(maxsize=2, sketch_width=64)
+        cache["a"] = 1
+        cache["b"] = 2
+        for _ in range(3):
+            cache.get("c")
+
+        cache["c"] = 3
+
+        assert set(cache) == {"b", "c"}
+        assert list(cache._order) == ["b", "c"]
+
+    def test_hit_refreshes_recency(self) -> None:
+        """Test a hit moves the key away from the eviction end."""
+        cache: TinyLFUCache[str, int] = TinyLFUCache(maxsize=2, sketch_width=64)
+        cache["a"] = 1
+        cache["b"] = 2
+
+        assert cache["a"] == 1
+        assert cache.popitem() == ("b", 2)
+
+
+class TestClockCache:
+    """Test the CLOCK and WSCLOCK eviction policies."""
+
+    def test_referenced_entry_gets_second_chance(self) -> None:
+        """Test the hand clears a set bit and evicts the next entry."""
+        cache: ClockCache[str, int] = ClockCache(maxsize=3)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["c"] = 3
+        assert cache["a"] == 1
+
+        cache["d"] = 4
+
+        assert set(cache) == {"a", "c", "d"}
+        assert not cache._referenced[cache._slots["a"]]
+
+    def test_hand_keeps_sweeping_from_last_position(self) -> None:
+        """Test the next eviction resumes after the previous victim."""
+        cache: ClockCache[str, int] = ClockCache(maxsize=3)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["c"] = 3
+        assert cache["a"] == 1
+        cache["d"] = 4
+
+        cache["e"] = 5
+
+        assert set(cache) == {"a", "d", "e"}
+
+    def test_all_referenced_evicts_under_hand(self) -> None:
+        """Test a full revolution clears every bit before evicting."""
+        cache: ClockCache[str, int] = ClockCache(maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache["a"] == 1
+        assert cache["b"] == 2
+
+        assert cache.popitem() == ("a", 1)
+        assert not any(cache._referenced)
+
+    def test_wsclock_prefers_entry_outside_working_set(self) -> None:
+        """Test an idle entry is evicted before ones in the working set."""
+        cache: ClockCache[str, int] = ClockCache(maxsize=3, working_set=60)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["c"] = 3
+        cache._last_used[cache._slots["c"]] = time.monotonic() - 120
+
+        cache["d"] = 4
+
+        assert set(cache) == {"a", "b", "d"}
+
+    def test_wsclock_falls_back_to_first_unreferenced(self) -> None:
+        """Test the first unreferenced entry is evicted when every entry
+        is in the working set."""
+        cache: ClockCache[str, int] = ClockCache(maxsize=3, working_set=60)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["c"] = 3
+        assert cache["a"] == 1
+
+        cache["d"] = 4
+
+        assert set(cache) == {"a", "c", "d"}
+
+    def test_clear_resets_ring_and_hand(self) -> None:
+        """Test clear() frees every slot and rewinds the hand."""
+        cache: ClockCache[str, int] = ClockCache(maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache["b"] == 2
+        cache["c"] = 3
+        assert cache._hand != 0
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache._hand == 0
+        assert cache._slots == {}
+        assert all(key is ClockCache._FREE for key in cache._keys)
+        assert not any(cache._referenced)
+        assert sorted(cache._free) == [0, 1]
+
+        cache["x"] = 1
+        cache["y"] = 2
+        cache["z"] = 3
+        assert set(cache) == {"y", "z"}
+
+
+class TestPurgeExpired:
+    """Test the background sweep for expired entries."""
+
+    @pytest.mark.asyncio
+    async def test_purges_expired_entries(self) -> None:
+        """Test expired entries are removed and live ones are kept."""
+        cache = _make_cache("lru", maxsize=4)
+        await cache.set("live", 1)
+        await cache.setx("stale", 2, ttl=1)
+        cache._cache["stale"].expire_at = time.time() - 1
+
+        await cache._purge_expired()
+
+        assert list(cache._cache) == ["live"]
+
+    @pytest.mark.asyncio
+    async def test_sweep_keeps_lru_order(self) -> None:
+        """Test a sweep does not refresh the recency of the entries."""
+        cache = _make_cache("lru")
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")  # "b" is now the least recently used
+
+        await cache._purge_expired()
+        await cache.set("c", 3)
+
+        assert sorted(cache._cache) == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_sweep_keeps_clock_reference_bits(self) -> None:
+        """Test a sweep does not set CLOCK reference bits."""
+        cache = _make_cache("clock")
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        assert isinstance(cache._cache, ClockCache)
+
+        await cache._purge_expired()
+
+        assert not any(cache._cache._referenced)
+
+    @pytest.mark.asyncio
+    async def test_sweep_keeps_tinylfu_frequencies(self) -> None:
+        """Test a sweep does not count as an access in the sketch."""
+        cache = _make_cache("tinylfu")
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        assert isinstance(cache._cache, TinyLFUCache)
+        before = [cache._cache._sketch.estimate(key) for key in ("a", "b")]
+
+        await cache._purge_expired()
+
+        assert [cache._cache._sketch.estimate(key) for key in ("a", "b")] == before
+
+
+class TestListing:
+    """Test listing calls do not count as accesses."""
+
+    @pytest.mark.asyncio
+    async def test_len_and_keys_keep_lru_order(self) -> None:
+        """Test len() and keys() do not refresh the recency of the
+        entries."""
+        cache = _make_cache("lru")
+        await cache.set("test:a", 1)
+        await cache.set("test:b", 2)
+        await cache.get("test:a")  # "test:b" is now the least recently used
+
+        assert await cache.len() == 2
+        assert sorted(await cache.keys()) == ["test:a", "test:b"]
+        await cache.set("test:c", 3)
+
+        assert sorted(cache._cache) == ["test:a", "test:c"]
+
+    @pytest.mark.asyncio
+    async def test_len_and_items_keep_clock_reference_bits(self) -> None:
+        """Test len() and items() do not change which key gets evicted."""
+        cache = _make_cache("clock", maxsize=3)
+        await cache.set("test:a", 1)
+        await cache.set("test:b", 2)
+        await cache.set("test:c", 3)
+        await cache.get("test:a")  # Only "test:a" gets a second chance
+
+        assert await cache.len() == 3
+        assert len(await cache.items()) == 3
+        assert len(await cache.values()) == 3
+        await cache.set("test:d", 4)
+
+        assert sorted(cache._cache) == ["test:a", "test:c", "test:d"]
+
+    @pytest.mark.asyncio
+    async def test_listing_keeps_tinylfu_state(self) -> None:
+        """Test len(), keys(), items() and values() leave the sketch
+        estimates and the LRU order unchanged."""
+        cache = _make_cache("tinylfu", maxsize=3)
+        for key in ("test:a", "test:b", "test:c"):
+            await cache.set(key, 1)
+        await cache.get("test:a")
+        assert isinstance(cache._cache, TinyLFUCache)
+        estimates = {key: cache._cache._sketch.estimate(key) for key in cache._cache}
+        order = list(cache._cache._order)
+
+        assert await cache.len() == 3
+        assert len(await cache.keys()) == 3
+        assert len(await cache.items()) == 3
+        assert len(await cache.values()) == 3
+
+        assert {key: cache._cache._sketch.estimate(key) for key in cache._cache} == estimates
+        assert list(cache._cache._order) == order
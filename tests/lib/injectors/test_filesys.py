@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import pathlib
+
+from audex.config import Config
+from audex.lib.injectors.filesys import make_filesys
+
+
+class TestMakeFilesys:
+    """Test building the file system manager from the config."""
+
+    def test_skips_standard_streams(self, tmp_path: pathlib.Path) -> None:
+        """Test validated stdout/stderr targets are not treated as files."""
+        config = Config.model_validate({
+            "core": {
+                "logging": {
+                    "targets": [
+                        {"logname": "stdout"},
+                        {"logname": "stderr"},
+                        {"logname": str(tmp_path / "audex.log")},
+                    ]
+                }
+            },
+            "infrastructure": {"store": {"base_url": str(tmp_path / "store")}},
+        })
+
+        filesys = make_filesys(config)
+
+        assert filesys.log_paths == [(tmp_path / "audex.log").resolve()]